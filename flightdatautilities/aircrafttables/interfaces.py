@@ -67,7 +67,7 @@ class VelocitySpeed(metaclass=abc.ABCMeta):
         return np.ma.array(
             data=np.ones_like(array.data) * value,
             mask=array.mask if mask is None else mask,
-            dtype=np.float,
+            dtype=float,
         )
 
     def _determine_vspeed(self, name, **kwargs):
@@ -174,7 +174,7 @@ class VelocitySpeed(metaclass=abc.ABCMeta):
             else:
                 raise ValueError('Invalid v-speed table structure.')
 
-            array = array.round().astype(np.int)
+            array = array.round().astype(int)
             return array[0] if scalar else array
 
         if name == 'vls_clean':
@@ -211,7 +211,7 @@ class VelocitySpeed(metaclass=abc.ABCMeta):
                 # Build interpolation grid
                 x = sorted(lookup['weight'].keys())
                 y = lookup['altitude']
-                z = np.array([lookup['weight'][xi] for xi in x], dtype=np.float)
+                z = np.array([lookup['weight'][xi] for xi in x], dtype=float)
                 interp = scipy.interpolate.RegularGridInterpolator(
                     (x, y), z,
                     bounds_error=False,
@@ -225,7 +225,7 @@ class VelocitySpeed(metaclass=abc.ABCMeta):
                 # Mask values outside the table lookup
                 array = np.ma.masked_invalid(array)
                 # Round to the nearest int
-                array = array.round().astype(np.int)
+                array = array.round().astype(int)
 
             return array[0] if scalar else array
 
@@ -255,7 +255,7 @@ class VelocitySpeed(metaclass=abc.ABCMeta):
                 raise ValueError('Invalid v-speed table structure.')
 
             if not name == 'mmo':
-                array = array.round().astype(np.int)
+                array = array.round().astype(int)
             return array[0] if scalar else array
 
         raise ValueError('Unknown velocity speed table name: %s', name)
@@ -2,9 +2,14 @@
 Multi-state Parameter State Value Mappings
 '''
 
+import collections
+import functools
 import re
+import types
 
-from flightdatautilities.patterns import wildcard_match
+import numpy as np
+
+from flightdatautilities.patterns import WILDCARD, pattern_regex
 
 PARAMETER_CORRECTIONS = {
     '115 VAC Standby Bus': {1: 'On'},
@@ -132,7 +137,6 @@ PARAMETER_CORRECTIONS = {
     'Flare Engaged': {1: 'Engaged'},
     'Flight Path Vector Selected (*)': {1: 'Selected'},
     'Fuel Qty (*) Low': {1: 'Warning'},
-    'Fuel Qty (*) Low': {1: 'Warning'},
     'GNSS Output Correction': {1: 'Corrected'},
     'GPS Active': {1: 'Active'},
     'GPS Approach': {1: 'GPS'},
@@ -269,7 +273,6 @@ PARAMETER_CORRECTIONS = {
     'TAWS Obstacle': {1: 'Warning'},
     'TAWS Predictive Windshear': {1: 'Warning'},
     'TAWS Pull Up': {1: 'Warning'},
-    'TAWS Pull Up': {1: 'Warning'},
     'TAWS Sink Rate': {1: 'Warning'},
     'TAWS Terrain Ahead Pull Up': {1: 'Warning'},
     'TAWS Terrain Ahead': {1: 'Warning'},
@@ -281,7 +284,6 @@ PARAMETER_CORRECTIONS = {
     'TAWS Terrain Override': {1: 'Override'},
     'TAWS Terrain Pull Up': {1: 'Warning'},
     'TAWS Terrain Pull Up Ahead': {1: 'Warning'},
-    'TAWS Terrain Pull Up': {1: 'Warning'},
     'TAWS Terrain Warning': {1: 'Warning'},
     'TAWS Terrain': {1: 'Warning'},
     'TAWS Too Low Flap': {1: 'Warning'},
@@ -466,6 +468,10 @@ PARAMETER_CORRECTIONS = {
 
 }
 
+# The corrected mappings are shared by every caller (and cached lookups), so
+# expose them as read-only views to prevent accidental modification.
+PARAMETER_CORRECTIONS = {k: types.MappingProxyType(v) for k, v in PARAMETER_CORRECTIONS.items()}
+
 
 STATE_CORRECTIONS = {
     '': '-',
@@ -577,7 +583,6 @@ STATE_CORRECTIONS = {
     'FLIGHT': 'Air',
     'FULL EXT': 'Full Extended',
     'FTHRD': 'Feathered',
-    'FULL EXT': 'Full Extended',
     'GND': 'Ground',
     'GROUND': 'Ground',
     'HI PRESS': 'High Press',
@@ -600,7 +605,6 @@ STATE_CORRECTIONS = {
     'LOCKOUT': 'Lockout',
     'LO PRESS': 'Low Press',
     'LOPRESS': 'Low Press',
-    'LOPRESS': 'Low Press',
     'LOW PRESS': 'Low Press',
     'LOW SPEED': 'Low',
     'LOW QTY': 'Low',
@@ -888,7 +892,7 @@ STATE_CORRECTIONS = {
 }
 
 
-TRUE_STATES = [
+TRUE_STATES = frozenset({
     'APU Bleed Valve not Fully Open',
     'APU Fire',
     'Aft CG',
@@ -913,10 +917,10 @@ TRUE_STATES = [
     'Unlocked',
     'Valid',
     'Warning',
-]
+})
 
 
-FALSE_STATES = [
+FALSE_STATES = frozenset({
     'APU Bleed Valve Fully Open',
     'Air',
     'Armed',
@@ -937,7 +941,7 @@ FALSE_STATES = [
     'Not in CWS Mode',
     'Off',
     'Up',
-]
+})
 
 
 # Examples where states conflict:
@@ -948,30 +952,69 @@ FALSE_STATES = [
 # Functions
 
 
+# Wildcard patterns are indexed by their first word, which is always literal,
+# so a lookup only has to consider patterns which could possibly match.
+_WILDCARD_CORRECTIONS = collections.defaultdict(list)
+for _pattern, _mapping in PARAMETER_CORRECTIONS.items():
+    if WILDCARD in _pattern:
+        _WILDCARD_CORRECTIONS[_pattern.split(' ', 1)[0]].append((_pattern, _mapping))
+_WILDCARD_CORRECTIONS = dict(_WILDCARD_CORRECTIONS)
+del _pattern, _mapping
+
+
+@functools.lru_cache(maxsize=None)
+def _wildcard_regex(word):
+    '''
+    Compile the wildcard patterns starting with a word into a single regex.
+
+    Each pattern has its own group so that the index of the matching group
+    identifies the pattern. Alternatives are tried in order so the first
+    matching pattern wins. Compiling all of the patterns is relatively slow so
+    it is deferred until the patterns for a word are first needed.
+    '''
+    return re.compile('(?ms)' + '|'.join(f'({pattern_regex(p)})' for p, m in _WILDCARD_CORRECTIONS[word]))
+
+
+@functools.lru_cache(maxsize=4096)
 def get_parameter_correction(parameter_name):
+    '''
+    Lookup the state mapping correction for a parameter.
 
+    Results are cached as the same parameter names are looked up repeatedly.
+    The returned mapping is a shared read-only view.
+
+    :param parameter_name: Name of the parameter.
+    :type parameter_name: str
+    :returns: Corrected state mapping or None if no correction is defined.
+    :rtype: types.MappingProxyType or None
+    '''
     if parameter_name in PARAMETER_CORRECTIONS:
         return PARAMETER_CORRECTIONS[parameter_name]
 
-    for pattern, mapping in PARAMETER_CORRECTIONS.items():
-        if wildcard_match(pattern, [parameter_name]):
-            return mapping
+    word = parameter_name.split(' ', 1)[0]
+    if word not in _WILDCARD_CORRECTIONS:
+        return None
 
+    match = _wildcard_regex(word).match(parameter_name)
+    if match:
+        return _WILDCARD_CORRECTIONS[word][match.lastindex - 1][1]
 
-def normalise_discrete_mapping(original_mapping, parameter_name=None):
 
-    true_state = original_mapping[1]
-    false_state = original_mapping[0]
+def normalise_discrete_mapping(original_mapping, parameter_name=None):
 
-    true_state = STATE_CORRECTIONS.get(true_state, true_state)
-    false_state = STATE_CORRECTIONS.get(false_state, false_state)
+    correct = STATE_CORRECTIONS.get
+    true_state = correct(original_mapping[1], original_mapping[1])
+    false_state = correct(original_mapping[0], original_mapping[0])
 
     inverted = true_state in FALSE_STATES or false_state in TRUE_STATES
 
     normalised_mapping = \
         get_parameter_correction(parameter_name) if parameter_name else None
 
-    if not normalised_mapping:
+    # Parameter corrections are shared read-only views so return a copy.
+    if normalised_mapping:
+        normalised_mapping = dict(normalised_mapping)
+    else:
         normalised_mapping = {0: false_state, 1: true_state}
 
     return normalised_mapping, inverted
@@ -982,10 +1025,64 @@ def normalise_multistate_mapping(original_mapping, parameter_name=None):
     normalised_mapping = \
         get_parameter_correction(parameter_name) if parameter_name else None
 
-    if not normalised_mapping:
-        normalised_mapping = {}
-
-        for value, state in original_mapping.items():
-            normalised_mapping[value] = STATE_CORRECTIONS.get(state, state)
+    # Parameter corrections are returned as defined (copied from the shared
+    # read-only view); STATE_CORRECTIONS is only applied to the original
+    # states when there is no parameter correction.
+    if normalised_mapping:
+        normalised_mapping = dict(normalised_mapping)
+    else:
+        correct = STATE_CORRECTIONS.get
+        normalised_mapping = {value: correct(state, state) for value, state in original_mapping.items()}
 
     return normalised_mapping
+
+
+def build_state_lookup_array(mapping, default=None):
+    '''
+    Build an array for translating raw state values into state names.
+
+    Indexing the lookup array with an integer array of raw values, e.g.
+    ``lookup[values]``, translates all of the values at once rather than
+    looking up each value in the mapping. The array only extends to the
+    largest raw value in the mapping, so indexing it directly raises
+    IndexError for larger values and wraps around for negative values. Use
+    ``lookup_states`` if the raw values may be outside of the mapping.
+
+    :param mapping: Raw value to state mapping, e.g. a normalised mapping.
+    :type mapping: dict
+    :param default: State for raw values below the largest raw value in the mapping which are not in the mapping.
+    :type default: object
+    :raises ValueError: If the mapping has a negative raw value.
+    :returns: Object array of states indexed by raw value.
+    :rtype: np.ndarray
+    '''
+    if any(value < 0 for value in mapping):
+        raise ValueError('Cannot build a state lookup array for negative raw values.')
+    lookup = np.full(max(mapping, default=-1) + 1, default, dtype=object)
+    for value, state in mapping.items():
+        lookup[value] = state
+    return lookup
+
+
+def lookup_states(lookup, values, default=None):
+    '''
+    Translate raw state values into state names with a lookup array.
+
+    Raw values outside of the lookup array, including negative values, are
+    translated to the default state rather than raising IndexError or
+    wrapping around to the end of the array.
+
+    :param lookup: Lookup array from ``build_state_lookup_array``.
+    :type lookup: np.ndarray
+    :param values: Integer raw state values.
+    :type values: np.ndarray
+    :param default: State for raw values outside of the lookup array.
+    :type default: object
+    :returns: Object array of states with the same shape as values.
+    :rtype: np.ndarray
+    '''
+    values = np.asarray(values)
+    valid = (values >= 0) & (values < len(lookup))
+    states = np.full(values.shape, default, dtype=object)
+    states[valid] = lookup[values[valid]]
+    return states
@@ -1,6 +1,36 @@
+import functools
 import string
 
 
+class _KeepTable(dict):
+    '''
+    Translation table for ``str.translate`` which deletes every character that
+    is not in ``keep``. Entries are filled in lazily as characters are seen as
+    the input may contain any unicode character.
+    '''
+
+    def __init__(self, keep):
+        super().__init__()
+        self.keep = keep
+
+    def __missing__(self, ordinal):
+        value = self[ordinal] = ordinal if chr(ordinal) in self.keep else None
+        return value
+
+
+@functools.lru_cache(maxsize=32)
+def _punctuation_table(keep, remove_whitespace):
+    '''
+    Build the translation table for ``remove_punctuation``.
+
+    Tables are cached as the same arguments are typically used repeatedly.
+    '''
+    keep = set(string.ascii_letters + string.digits + keep)
+    if not remove_whitespace:
+        keep.update(string.whitespace)
+    return _KeepTable(keep)
+
+
 def remove_punctuation(string_in, keep='', remove_whitespace=False):
     r"""
     Remove all punctuation characters from input string.
@@ -12,7 +42,4 @@ def remove_punctuation(string_in, keep='', remove_whitespace=False):
     Punctuation removed by default:
     '!"#$%&'()*+,-./:;<=>?@[\]^_`{|}~'
     """
-    keep = set(string.ascii_letters + string.digits + keep)
-    if not remove_whitespace:
-        keep.update(string.whitespace)
-    return ''.join(c for c in string_in if c in keep)
+    return string_in.translate(_punctuation_table(keep, bool(remove_whitespace)))
@@ -1,3 +1,4 @@
+import itertools
 import types
 
 from flightdatautilities.dict_helpers import dcompact
@@ -30,19 +31,25 @@ class Struct(dict):
         :rtype: Struct
         '''
         if isinstance(d, types.GeneratorType):
-            generator = d
+            items, parents = d, frozenset()
         else:
-            d = d.copy()
-            d.update(kwargs)
-            generator = d.items()
-        for k, v in generator:
-            if type(v) == Struct:
-                # Ensure that we clone structures (uses dict.copy())
-                setattr(self, k, Struct(v.copy()))
-            elif type(v) == dict:
-                setattr(self, k, Struct(v))
-            else:
-                setattr(self, k, v)
+            items, parents = itertools.chain(d.items(), kwargs.items()), frozenset((id(d),))
+        # Nested structures and dictionaries are cloned into new structures
+        # iteratively to avoid recursion and intermediate dictionary copies.
+        # The dictionaries being expanded are tracked to detect cycles:
+        struct = Struct
+        pending = [(self, items, parents)]
+        while pending:
+            s, items, parents = pending.pop()
+            for k, v in items:
+                cls = v.__class__
+                if cls is struct or cls is dict:
+                    if id(v) in parents:
+                        raise ValueError('Cannot create a structure from a dictionary containing itself.')
+                    child = struct()
+                    pending.append((child, v.items(), parents | {id(v)}))
+                    v = child
+                dict.__setitem__(s, k, v)
     
     def __getattr__(self, key):
         '''
@@ -58,14 +65,14 @@ class Struct(dict):
         '''
         try:
             # Attempt to get a value for the specified attribute key:
-            return self.__getitem__(key)
+            return self[key]
         except KeyError:
             # Ensure that we do not create new structure for magic attributes:
-            if key.startswith('__') and key.endswith('__'):
+            if key[:2] == '__' == key[-2:]:
                 raise AttributeError('\'%s\' object has no attribute \'%s\'' % (
                     self.__class__.__name__,
                     key,
-                ))
+                )) from None
             # Create new structures for unknown attributes: 
             s = Struct()
             setattr(self, key, s)
@@ -89,5 +96,6 @@ class Struct(dict):
         :returns: The structure converted to a dictionary.
         :rtype: dict
         '''
-        convert = lambda v: v.to_dict() if type(v) == Struct else v
+        struct = Struct
+        convert = lambda v: v.to_dict() if v.__class__ is struct else v
         return dcompact(dict((k, convert(v)) for k, v in self.items()))
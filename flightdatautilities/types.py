@@ -1,9 +1,11 @@
-import functools
+import calendar
+import math
 import re
-from datetime import date, datetime, time, timezone
+from datetime import date, datetime, timezone
+from types import MappingProxyType
 
 # TODO: Attempt to determine a formula? See https://aviation.stackexchange.com/q/42490
-LOCALIZER_TO_GLIDESLOPE_FREQUENCY_MAPPING = {
+LOCALIZER_TO_GLIDESLOPE_FREQUENCY_MAPPING = MappingProxyType({
     108.10: 334.70,
     108.15: 334.55,
     108.30: 334.10,
@@ -44,38 +46,110 @@ LOCALIZER_TO_GLIDESLOPE_FREQUENCY_MAPPING = {
     111.75: 333.35,
     111.90: 331.10,
     111.95: 330.95,
+})
+GLIDESLOPE_TO_LOCALIZER_FREQUENCY_MAPPING = MappingProxyType(
+    {v: k for k, v in LOCALIZER_TO_GLIDESLOPE_FREQUENCY_MAPPING.items()}
+)
+
+
+def _tacan_frequency(channel, navaid):
+    '''
+    Calculate the frequency of a navigational aid for a TACAN channel.
+
+    Used to build the frequency lookup tables for ``TACAN``.
+    '''
+    number, letter = int(channel[:-1]), channel[-1:].upper()
+    if number < 16 or 60 <= number <= 60:
+        return None
+    if (number % 2 or number > 57) and navaid in {'glideslope', 'localizer'}:
+        return None
+    if not number % 2 and number < 57 and navaid == 'vor':
+        return None
+    frequency = number / 10 + (0.05 if letter == 'Y' else 0.00)
+    if 17 <= number <= 59:
+        frequency = frequency + 106.30
+    if 70 <= number <= 126:
+        frequency = frequency + 105.30
+    frequency = round(frequency, 2)
+    if navaid == 'glideslope':
+        return LOCALIZER_TO_GLIDESLOPE_FREQUENCY_MAPPING.get(frequency)
+    return frequency
+
+
+def _tacan_channel(frequency):
+    '''
+    Calculate the TACAN channel and navigational aid for a frequency.
+
+    Used to build the channel lookup table for ``TACAN``.
+    '''
+    converted = GLIDESLOPE_TO_LOCALIZER_FREQUENCY_MAPPING.get(frequency, frequency)
+    letter = 'Y' if converted * 100 // 1 % 10 else 'X'
+    if letter == 'Y':
+        converted = round(converted - 0.05, 2)
+    if 328.60 <= frequency <= 335.40:
+        number = (converted - 106.3) * 10
+        return f'{number:.0f}{letter:s}', 'glideslope'
+    if 108.0 <= frequency <= 112.25:
+        number = (converted - 106.3) * 10
+        navaid = 'localizer' if converted < 112 and converted * 10 // 1 % 10 % 2 else 'vor'
+        return f'{number:.0f}{letter:s}', navaid
+    if 112.30 <= frequency <= 117.95:
+        number = (converted - 105.3) * 10
+        return f'{number:.0f}{letter:s}', 'vor'
+
+
+# Lookup tables for TACAN conversions. Channels are keyed by the frequency in
+# multiples of 0.05 MHz which is the spacing between adjacent channels.
+_TACAN_VALID_CHANNELS = frozenset(f'{number}{letter}' for number in range(1, 127) for letter in 'XY')
+_TACAN_FREQUENCIES = {
+    navaid: {
+        channel: frequency
+        for channel in _TACAN_VALID_CHANNELS
+        if (frequency := _tacan_frequency(channel, navaid)) is not None
+    }
+    for navaid in ('glideslope', 'localizer', 'vor')
 }
-GLIDESLOPE_TO_LOCALIZER_FREQUENCY_MAPPING = {v: k for k, v in LOCALIZER_TO_GLIDESLOPE_FREQUENCY_MAPPING.items()}
+_TACAN_CHANNELS = {
+    step: channel
+    for steps in (range(2160, 2360), range(6572, 6709))
+    for step in steps
+    if (channel := _tacan_channel(step / 20)) is not None
+}
+
+# Timestamps for the end of each year covered by two digit AIRAC identifiers:
+_AIRAC_YEAR_ENDS = {year: calendar.timegm((year, 12, 31, 0, 0, 0)) for year in range(1963, 2064)}
 
 
-@functools.total_ordering
 class AIRAC:
     BASE = -188092800  # 1964-01-16 / 6401
     DELTA = 2419200  # 28 days
 
-    __slots__ = ['timestamp']
+    __slots__ = ['timestamp', '_effective', '_identifier']
 
     def __init__(self, value):
+        if value.__class__ is str and value in _AIRAC_IDENTIFIERS:
+            object.__setattr__(self, 'timestamp', _AIRAC_IDENTIFIERS[value])
+            return
         if isinstance(value, date):
-            timestamp, extra = datetime.combine(value, time.min).replace(tzinfo=timezone.utc).timestamp(), None
+            timestamp, extra = calendar.timegm((value.year, value.month, value.day, 0, 0, 0)), None
         elif isinstance(value, datetime):
-            timestamp, extra = value.timestamp(), None
+            timestamp, extra = calendar.timegm(value.utctimetuple()), None
         elif isinstance(value, (int, float)) and not isinstance(value, bool):
-            timestamp, extra = value, None
+            timestamp, extra = math.floor(value), None
         elif isinstance(value, str):
             if not value.isdigit() or len(value) != 4:
                 raise ValueError(f'Invalid AIRAC identifier: {value!r}')
             year, ordinal = int(value[:2]), int(value[2:])
             year += 2000 if year < 64 else 1900
-            timestamp = datetime(year - 1, 12, 31, tzinfo=timezone.utc).timestamp()
+            timestamp = _AIRAC_YEAR_ENDS[year - 1]
             extra = ordinal * self.DELTA
         else:
             raise TypeError(f'Invalid AIRAC identifier: {value!r}')
         if timestamp < self.BASE:
             raise ValueError('AIRAC identifiers were not defined before 1964-01-16.')
-        super().__setattr__('timestamp', timestamp + (extra or 0) - (timestamp - self.BASE) % self.DELTA)
+        object.__setattr__(self, 'timestamp', timestamp + (extra or 0) - (timestamp - self.BASE) % self.DELTA)
         if extra is not None:
-            if extra <= 0 or self.timestamp > datetime(year, 12, 31, tzinfo=timezone.utc).timestamp():
+            if extra <= 0 or self.timestamp > _AIRAC_YEAR_ENDS[year]:
                 raise ValueError(f'Invalid AIRAC identifier: {value!r}')
 
     @property
@@ -84,15 +158,27 @@ class AIRAC:
 
     @property
     def ordinal(self):
-        return (self.effective.timetuple().tm_yday - 1) // 28 + 1
+        effective = self.effective
+        return (effective.toordinal() - date(effective.year, 1, 1).toordinal()) // 28 + 1
 
     @property
     def effective(self):
-        return datetime.fromtimestamp(self.timestamp, timezone.utc)
+        # Cached on first access as instances are immutable.
+        try:
+            return self._effective
+        except AttributeError:
+            effective = datetime.fromtimestamp(self.timestamp, timezone.utc)
+            object.__setattr__(self, '_effective', effective)
+            return effective
 
     @property
     def identifier(self):
-        return f'{self.year:02d}{self.ordinal:02d}'
+        try:
+            return self._identifier
+        except AttributeError:
+            identifier = f'{self.year:02d}{self.ordinal:02d}'
+            object.__setattr__(self, '_identifier', identifier)
+            return identifier
 
     def __setattr__(self, key, value):
         raise TypeError('AIRAC objects are immutable.')
@@ -113,8 +199,36 @@ class AIRAC:
             return NotImplemented
         return self.timestamp < other.timestamp
 
+    def __le__(self, other):
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+        return self.timestamp <= other.timestamp
+
+    def __gt__(self, other):
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+        return self.timestamp > other.timestamp
+
+    def __ge__(self, other):
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+        return self.timestamp >= other.timestamp
+
+
+# Timestamps for every valid two digit AIRAC identifier so that parsing is a
+# single lookup. Identifiers for 1964 are rejected by the constructor as they
+# would be counted from before the first cycle, so they are excluded here.
+_AIRAC_IDENTIFIERS = {}
+for _year in range(1965, 2064):
+    _start = _AIRAC_YEAR_ENDS[_year - 1]
+    _start -= (_start - AIRAC.BASE) % AIRAC.DELTA
+    for _ordinal in range(1, 15):
+        if _start + _ordinal * AIRAC.DELTA > _AIRAC_YEAR_ENDS[_year]:
+            break
+        _AIRAC_IDENTIFIERS[f'{_year % 100:02d}{_ordinal:02d}'] = _start + _ordinal * AIRAC.DELTA
+del _year, _start, _ordinal
+
 
-@functools.total_ordering
 class TACAN:
     PATTERN = re.compile(r'^(?:[1-9]|[1-9][0-9]|1[01][0-9]|12[0-6])[XY]$')
 
@@ -123,9 +237,9 @@ class TACAN:
     def __init__(self, value):
         if not isinstance(value, str):
             raise TypeError(f'Invalid TACAN channel: {value!r}')
-        elif not self.PATTERN.match(value):
+        elif value not in _TACAN_VALID_CHANNELS:
             raise ValueError(f'Invalid TACAN channel: {value!r}')
-        super().__setattr__('channel', value)
+        object.__setattr__(self, 'channel', value)
 
     def __setattr__(self, key, value):
         raise TypeError('TACAN objects are immutable.')
@@ -146,42 +260,28 @@ class TACAN:
             return NotImplemented
         return self.channel < other.channel
 
+    def __le__(self, other):
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+        return self.channel <= other.channel
+
+    def __gt__(self, other):
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+        return self.channel > other.channel
+
+    def __ge__(self, other):
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+        return self.channel >= other.channel
+
     def to_frequency(self, navaid):
         """Convert a TACAN channel number to a frequency for a navigational aid."""
-        if navaid not in {'glideslope', 'localizer', 'vor'}:
+        if navaid not in _TACAN_FREQUENCIES:
             raise ValueError('Expected navaid argument to be glideslope, localizer or vor.')
-        number, letter = int(self.channel[:-1]), self.channel[-1:].upper()
-        if number < 16 or 60 <= number <= 60:
-            return None
-        if (number % 2 or number > 57) and navaid in {'glideslope', 'localizer'}:
-            return None
-        if not number % 2 and number < 57 and navaid == 'vor':
-            return None
-        frequency = number / 10 + (0.05 if letter == 'Y' else 0.00)
-        if 17 <= number <= 59:
-            frequency = frequency + 106.30
-        if 70 <= number <= 126:
-            frequency = frequency + 105.30
-        frequency = round(frequency, 2)
-        if navaid == 'glideslope':
-            return LOCALIZER_TO_GLIDESLOPE_FREQUENCY_MAPPING[frequency]
-        return frequency
+        return _TACAN_FREQUENCIES[navaid].get(self.channel)
 
     @staticmethod
     def from_frequency(frequency):
         """Convert a frequency for a navigational aid to a TACAN channel number."""
-        frequency = round(float(frequency) * 20) / 20  # round to nearest 0.05
-        converted = GLIDESLOPE_TO_LOCALIZER_FREQUENCY_MAPPING.get(frequency, frequency)
-        letter = 'Y' if converted * 100 // 1 % 10 else 'X'
-        if letter == 'Y':
-            converted = round(converted - 0.05, 2)
-        if 328.60 <= frequency <= 335.40:
-            number = (converted - 106.3) * 10
-            return f'{number:.0f}{letter:s}', 'glideslope'
-        if 108.0 <= frequency <= 112.25:
-            number = (converted - 106.3) * 10
-            navaid = 'localizer' if converted < 112 and converted * 10 // 1 % 10 % 2 else 'vor'
-            return f'{number:.0f}{letter:s}', navaid
-        if 112.30 <= frequency <= 117.95:
-            number = (converted - 105.3) * 10
-            return f'{number:.0f}{letter:s}', 'vor'
+        return _TACAN_CHANNELS.get(round(float(frequency) * 20))  # round to nearest 0.05
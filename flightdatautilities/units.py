@@ -8,6 +8,10 @@ The following links are useful resources:
 '''
 
 import decimal
+import functools
+import itertools
+import operator
+import types
 
 import numpy as np
 
@@ -244,7 +248,7 @@ CONVERSION_MULTIPLIERS = {
         LB_S: 0.000612395,
         LB_MIN: 0.0367437104,
         LB_H: 2.204622622,
-        KG_H: 0.0002777777777777778,
+        KG_S: 0.0002777777777777778,
         TONNE_H: 0.001,
     },
     TONNE_H: {
@@ -257,45 +261,45 @@ CONVERSION_MULTIPLIERS = {
     # Flow (Volume):
     PINT_H: {
         QUART_H: 0.5,
-        GALLON_S: 450.0,
+        GALLON_S: 3.47222222E-05,
         GALLON_H: 0.125,
         CUFT_M: 0.0002785,
         LITER_H: 0.473176,
     },
     QUART_H: {
         PINT_H: 2,
-        GALLON_S: 900.0,
+        GALLON_S: 6.94444444E-05,
         GALLON_H: 0.25,
         CUFT_M: 0.000557,
         LITER_H: 0.946353,
     },
     GALLON_S: {
-        PINT_H: 0.002222222,
-        QUART_H: 0.001111111,
-        GALLON_H: 0.000277778,
-        CUFT_M: 6.18889E-07,
-        LITER_H: 0.001051503,
+        PINT_H: 28800.0,
+        QUART_H: 14400.0,
+        GALLON_H: 3600.0,
+        CUFT_M: 8.020833333,
+        LITER_H: 13627.47648,
     },
     GALLON_H: {
         PINT_H: 8,
         QUART_H: 4,
-        GALLON_S: 3600.0,
+        GALLON_S: 0.0002777777777777778,
         CUFT_M: 0.002228,
         LITER_H: 3.78541,
     },
     CUFT_M: {
         PINT_H: 3590.664273,
         QUART_H: 1795.332136,
-        GALLON_S: 1615798.923,
+        GALLON_S: 0.1246758428,
         GALLON_H: 448.8330341,
-        LITER_H: 1.699,
+        LITER_H: 1699.010796,
     },
     LITER_H: {
         PINT_H: 2.11338,
         QUART_H: 1.05669,
-        GALLON_S: 951.0198367,
+        GALLON_S: 7.33811111E-05,
         GALLON_H: 0.264172,
-        CUFT_M: 0.0005886,
+        CUFT_M: 0.000588578,
     },
     # Force:
     LBF: {
@@ -419,25 +423,32 @@ CONVERSION_MULTIPLIERS = {
     },
     # Pressure:
     INHG: {
+        BAR: 0.03386389,
         MILLIBAR: 33.86389,
         PASCAL: 3386.389,
         HECTOPASCAL: 33.86389,
+        KILOPASCAL: 3.386389,
         PSI: 0.491154221,
     },
     BAR: {
         INHG: 29.529983071415973,
+        MILLIBAR: 1000,
         PASCAL: 100000,
         HECTOPASCAL: 1000,
+        KILOPASCAL: 100,
         PSI: 14.5037738,
     },
     MILLIBAR: {
         INHG: 0.02952998,
+        BAR: 0.001,
         PASCAL: 100,
         HECTOPASCAL: 1,
+        KILOPASCAL: 0.1,
         PSI: 0.014503774,
     },
     PASCAL: {
         INHG: 0.0002952998,
+        BAR: 0.00001,
         MILLIBAR: 0.01,
         HECTOPASCAL: 0.01,
         KILOPASCAL: 0.001,
@@ -445,21 +456,27 @@ CONVERSION_MULTIPLIERS = {
     },
     HECTOPASCAL: {
         INHG: 0.02952998,
+        BAR: 0.001,
         MILLIBAR: 1,
         PASCAL: 100,
+        KILOPASCAL: 0.1,
         PSI: 0.014503774,
     },
     KILOPASCAL: {
         INHG: 0.2952998,
+        BAR: 0.01,
         MILLIBAR: 10,
         PASCAL: 1000,
+        HECTOPASCAL: 10,
         PSI: 0.14503774,
     },
     PSI: {
         INHG: 2.036020375,
+        BAR: 0.0689475729,
         MILLIBAR: 68.94757,
         PASCAL: 6894.757,
         HECTOPASCAL: 68.94757,
+        KILOPASCAL: 6.894757,
     },
     # Speed:
     KT: {
@@ -517,7 +534,7 @@ CONVERSION_MULTIPLIERS = {
         IN_OZ: 192,
     },
     IN_LB: {
-        FT_LB: 0.0833,
+        FT_LB: 0.0833333333,
         IN_OZ: 16,
     },
     IN_OZ: {
@@ -553,9 +570,11 @@ CONVERSION_MULTIPLIERS = {
         DOTS: 12.903225806451614,
     },
     MICROVOLT: {
+        MILLIVOLT: 0.001,
         DOTS: 0.00001333333333333,
     },
     MILLIVOLT: {
+        MICROVOLT: 1000,
         DOTS: 0.01333333333333333,
     },
     MICROAMP: {
@@ -609,6 +628,39 @@ CONVERSION_FUNCTIONS = {
 }
 
 
+# Flattened conversion tables keyed by pairs of standard units:
+_MULTIPLIERS = {(u, v): k for u, row in CONVERSION_MULTIPLIERS.items() for v, k in row.items()}
+_FUNCTIONS = {(u, v): f for u, row in CONVERSION_FUNCTIONS.items() for v, f in row.items()}
+
+# The conversion tables are frozen as changes would not be reflected in the
+# flattened tables above or in cached lookups:
+CONVERSION_MULTIPLIERS = types.MappingProxyType(
+    {k: types.MappingProxyType(v) for k, v in CONVERSION_MULTIPLIERS.items()}
+)
+CONVERSION_FUNCTIONS = types.MappingProxyType(
+    {k: types.MappingProxyType(v) for k, v in CONVERSION_FUNCTIONS.items()}
+)
+
+# Temperature conversions as the sequence of operations applied by the
+# functions above. Arrays are converted by applying the first operation to
+# create a new array and the remaining operations in place, giving the same
+# result as the functions without creating intermediate arrays.
+_INPLACE_CONVERSIONS = {
+    (CELSIUS, FAHRENHEIT): ((np.multiply, 9.0), (np.true_divide, 5.0), (np.add, 32.0)),
+    (CELSIUS, KELVIN): ((np.add, 273.15),),
+    (CELSIUS, RANKINE): ((np.add, 273.15), (np.multiply, 9.0), (np.true_divide, 5.0)),
+    (FAHRENHEIT, CELSIUS): ((np.subtract, 32.0), (np.multiply, 5.0), (np.true_divide, 9.0)),
+    (FAHRENHEIT, KELVIN): ((np.add, 459.67), (np.multiply, 5.0), (np.true_divide, 9.0)),
+    (FAHRENHEIT, RANKINE): ((np.add, 459.67),),
+    (KELVIN, CELSIUS): ((np.subtract, 273.15),),
+    (KELVIN, FAHRENHEIT): ((np.multiply, 9.0), (np.true_divide, 5.0), (np.subtract, 459.67)),
+    (KELVIN, RANKINE): ((np.multiply, 9.0), (np.true_divide, 5.0)),
+    (RANKINE, CELSIUS): ((np.subtract, 491.67), (np.multiply, 5.0), (np.true_divide, 9.0)),
+    (RANKINE, FAHRENHEIT): ((np.subtract, 459.67),),
+    (RANKINE, KELVIN): ((np.multiply, 5.0), (np.true_divide, 9.0)),
+}
+
+
 STANDARD_CONVERSIONS = {
     # Acceleration
     MPS2: G,
@@ -652,6 +704,7 @@ STANDARD_CONVERSIONS = {
     GS_DDM: DOTS,
     LOC_DDM: DOTS,
 }
+STANDARD_CONVERSIONS = types.MappingProxyType(STANDARD_CONVERSIONS)
 
 
 UNIT_DISPLAY = {
@@ -669,6 +722,7 @@ UNIT_DISPLAY = {
     FPS2: 'ft/s²',
     LB_FT2: 'lb/ft²',
 }
+UNIT_DISPLAY = types.MappingProxyType(UNIT_DISPLAY)
 
 
 # This is the list of alternative forms of the units,
@@ -698,7 +752,6 @@ UNIT_CORRECTIONS = {
     'deg/sec^2': DEGREE_S2,
     # Angles:
     '\xb0': DEGREE,  # degree symbol
-    '°': DEGREE,
     '0': DEGREE,
     '°surface': DEGREE,
     '0surface': DEGREE,
@@ -716,9 +769,7 @@ UNIT_CORRECTIONS = {
     'Degrees RVDT': DEGREE,
     'Degrees upward': DEGREE,
     'degs.': DEGREE,
-    'Degree': DEGREE,
     'degree': DEGREE,
-    'Degrees': DEGREE,
     'degrees': DEGREE,
     'radian': RADIAN,
     'radians': RADIAN,
@@ -901,7 +952,6 @@ UNIT_CORRECTIONS = {
     'Inches': INCH,
     'inches': INCH,
     'IN': INCH,
-    'MM': MILLIMETER,
     'Mm': MILLIMETER,
     'mils': MIL,
     'Mil': MIL,
@@ -928,7 +978,6 @@ UNIT_CORRECTIONS = {
     'Inches Hg': INHG,
     'in Hg': INHG,
     'IN-HG': INHG,
-    'in Hg': INHG,
     'in-Hg': INHG,
     'in.Hg': INHG,
     'inhg': INHG,
@@ -997,11 +1046,9 @@ UNIT_CORRECTIONS = {
     'IPS': IPS,
     'meter/s': METER_S,
     'meters/s': METER_S,
-    'meter/s': METER_S,
     'meters/sec': METER_S,
     'metre/s': METER_S,
     'metres/s': METER_S,
-    'metre/s': METER_S,
     'metres/sec': METER_S,
     'M/s': METER_S,
     'm/sec': METER_S,
@@ -1015,7 +1062,6 @@ UNIT_CORRECTIONS = {
     # Temperature:
     b'\xb0C': CELSIUS,
     '\xb0C': CELSIUS,
-    '°C': CELSIUS,
     '° C': CELSIUS,
     '0C': CELSIUS,
     '\ufffdC': CELSIUS,  # �C is probably °C (see AE-2886)
@@ -1193,7 +1239,6 @@ UNIT_CORRECTIONS = {
     '% n1': PERCENT,
     '% mac': PERCENT,
     '% rpm': PERCENT,
-    '% N1': PERCENT,
     '% Mac': PERCENT,
     '% Rpm': PERCENT,
     '%N1': PERCENT,
@@ -1202,7 +1247,6 @@ UNIT_CORRECTIONS = {
     '%n1': PERCENT,
     '%mac': PERCENT,
     '%rpm': PERCENT,
-    '%N1': PERCENT,
     '%Mac': PERCENT,
     'MAC': PERCENT,
     'MAC %': PERCENT,
@@ -1212,7 +1256,6 @@ UNIT_CORRECTIONS = {
     '%Rpm': PERCENT,
     '%open': PERCENT,
     '%stroke': PERCENT,
-    '% Open': PERCENT,
     '% Open/Degrees': PERCENT,
     '% OPEN': PERCENT,
     '%full': PERCENT,
@@ -1234,6 +1277,7 @@ UNIT_CORRECTIONS = {
     'Di': DI,
     'DI': DI,
 }
+UNIT_CORRECTIONS = types.MappingProxyType(UNIT_CORRECTIONS)
 
 
 UNIT_CATEGORIES = {
@@ -1258,6 +1302,21 @@ UNIT_CATEGORIES = {
     'Volume': (PINT, QUART, GALLON, LITER),
     'Other': (DDM, GS_DDM, LOC_DDM, DOTS, TRIM, CYCLES, PERCENT, NM_KG, DU, DI, MIL, CU, SCALAR, MODE, NUM, UNITS, EPR),
 }
+UNIT_CATEGORIES = types.MappingProxyType(UNIT_CATEGORIES)
+
+_CATEGORIES = {unit: category for category, units in UNIT_CATEGORIES.items() for unit in units}
+
+
+# Dense table of multipliers indexed by integer unit codes which allows arrays
+# with different units for each value to be converted by gathering factors.
+# Pairs of units without a multiplier are NaN.
+_UNITS = tuple(sorted(itertools.chain.from_iterable(UNIT_CATEGORIES.values())))
+_UNIT_CODES = {unit: code for code, unit in enumerate(_UNITS)}
+_MULTIPLIER_MATRIX = np.full((len(_UNITS), len(_UNITS)), np.nan)
+np.fill_diagonal(_MULTIPLIER_MATRIX, 1.0)
+for (_unit, _output), _value in _MULTIPLIERS.items():
+    _MULTIPLIER_MATRIX[_UNIT_CODES[_unit], _UNIT_CODES[_output]] = _value
+del _unit, _output, _value
 
 
 UNIT_DESCRIPTIONS = {
@@ -1394,6 +1453,7 @@ UNIT_DESCRIPTIONS = {
     UNITS: 'units',
     EPR: 'engine pressure ratio',
 }
+UNIT_DESCRIPTIONS = types.MappingProxyType(UNIT_DESCRIPTIONS)
 
 
 UNIT_PROFILE_CONVERSIONS = {
@@ -1425,35 +1485,44 @@ UNIT_PROFILE_CONVERSIONS = {
         PINT: QUART,
     },
 }
+UNIT_PROFILE_CONVERSIONS = types.MappingProxyType(
+    {k: types.MappingProxyType(v) for k, v in UNIT_PROFILE_CONVERSIONS.items()}
+)
 
 
 ##############################################################################
 # Functions
 
 
+@functools.lru_cache(maxsize=None)
 def available(values=True):
     '''
-    Returns a list of units available that are defined in this module.
+    Returns the units available that are defined in this module.
 
-    If the ``constants`` flag is set a tuple of the module paired with the
+    If the ``values`` flag is not set a tuple of the module paired with the
     constant names will be returned instead of the string values.
 
+    The result is computed once and cached.
+
     :param values: whether to return values (default) or the constants.
     :type values: boolean
-    :returns: a list of unit string values or a tuple of module to constants.
-    :rtype: iterable
+    :returns: a tuple of unit string values or a tuple of module to constants.
+    :rtype: tuple
     '''
     import sys
     module = sys.modules[__name__]
-    x = dir(module)
-    x = list(filter(lambda v: v.isupper() and not v.startswith('_') and not v.endswith('_PROFILE'), x))
-    x = list(filter(lambda v: isinstance(getattr(module, v), str), x))
+    names = tuple(
+        name for name in dir(module)
+        if name.isupper() and not name.startswith('_') and not name.endswith('_PROFILE')
+        and isinstance(getattr(module, name), str)
+    )
     if values:
-        return map(lambda c: getattr(module, c), x)
+        return tuple(getattr(module, name) for name in names)
     else:
-        return module, x
+        return module, names
 
 
+@functools.lru_cache(maxsize=1024)
 def normalise(unit, profile=None):
     '''
     Normalises the provided unit to a well known form.
@@ -1469,35 +1538,55 @@ def normalise(unit, profile=None):
     return UNIT_PROFILE_CONVERSIONS.get(profile, {}).get(unit, unit) if profile else unit
 
 
+def category(unit):
+    '''
+    Returns the category of the provided unit.
+
+    :param unit: the unit to categorise.
+    :type unit: string
+    :returns: the category of the unit or None if the unit is not known.
+    :rtype: string
+    '''
+    return _CATEGORIES.get(normalise(unit))
+
+
+@functools.lru_cache(maxsize=512)
+def _function(unit, output):
+    '''
+    Looks up the conversion function for a pair of normalised units.
+
+    Results are cached as only a small number of unit pairs are ever used.
+    '''
+    if unit == output:
+        return lambda v: v
+
+    key = unit, output
+    if key in _FUNCTIONS:
+        return _FUNCTIONS[key]
+    if key in _MULTIPLIERS:
+        return functools.partial(operator.mul, _MULTIPLIERS[key])
+    return None
+
+
+@functools.lru_cache(maxsize=1024)
 def function(unit, output):
     '''
     Looks up the conversion function for the units provided.
 
+    Results are cached against the units as provided, so aliases are only
+    normalised the first time each pair is seen.
+
     :param unit: the unit to convert from.
     :type unit: string
     :param output: the unit to convert to.
     :type output: string
-    :returns: the conversion function
+    :returns: the conversion function or None if the units are not known.
     :rtype: function
     '''
-    unit0, unit1 = normalise(unit), normalise(output)
-
-    if unit0 == unit1:
-        return lambda v: v
-
-    try:
-        return CONVERSION_FUNCTIONS[unit0][unit1]
-    except KeyError:
-        pass
-
-    try:
-        return lambda v: v * CONVERSION_MULTIPLIERS[unit0][unit1]
-    except KeyError:
-        pass
-
-    return None
+    return _function(normalise(unit), normalise(output))
 
 
+@functools.lru_cache(maxsize=512)
 def multiplier(unit, output):
     '''
     Looks up the conversion multiplier for the units provided.
@@ -1510,7 +1599,7 @@ def multiplier(unit, output):
     :rtype: float
     '''
     unit0, unit1 = normalise(unit), normalise(output)
-    return 1 if unit == output else CONVERSION_MULTIPLIERS[unit0][unit1]
+    return 1 if unit == output else _MULTIPLIERS[unit0, unit1]
 
 
 def convert(value, unit, output):
@@ -1527,23 +1616,211 @@ def convert(value, unit, output):
     :rtype: numeric
     :raises: ValueError -- if any of the units are not known.
     '''
-    unit0, unit1 = normalise(unit), normalise(output)
+    if unit == output:
+        return value
+
+    conversion = _conversion(unit, output)
 
-    if unit0 == unit1:
+    if conversion is None:
         return value
 
     # XXX: Probably ought to preserve decimal type for precision?
-    if isinstance(value, decimal.Decimal):
+    if value.__class__ is not float and isinstance(value, decimal.Decimal):
         value = float(value)
 
+    func, operations = conversion
+    # 0-d arrays are excluded as ufuncs return scalars which can't be updated in place:
+    if operations and value.__class__ is np.ndarray and value.ndim:
+        return _apply(operations, value)
+
+    return func(value)
+
+
+def convert_array(values, unit, output, out=None):
+    '''
+    Converts an array of values from one unit to another.
+
+    The conversion is applied with numpy ufuncs and the result may be written
+    to an existing array, including ``values`` itself, to avoid allocating a
+    new array. As converted values are floating point, ``out`` must have a
+    floating point dtype unless the units are equivalent. If the units are
+    equivalent and ``out`` is not provided the values are returned unchanged.
+
+    :param values: the values to convert.
+    :type values: np.ndarray or array_like
+    :param unit: the unit to convert from.
+    :type unit: string
+    :param output: the unit to convert to.
+    :type output: string
+    :param out: the array to store the result in.
+    :type out: np.ndarray
+    :returns: the converted values
+    :rtype: np.ndarray
+    :raises: ValueError -- if any of the units are not known or ``out`` does not have a floating point dtype.
+    '''
+    values = np.asanyarray(values)
+    conversion = _conversion(unit, output)
+
+    if conversion is None:
+        if out is None:
+            return values
+        np.copyto(out, values)
+        return out
+
+    if out is not None and not np.issubdtype(out.dtype, np.inexact):
+        raise ValueError('Output array must have a floating point dtype: %s' % out.dtype)
+
+    func, operations = conversion
+    if operations:
+        return _apply(operations, values, out)
+    if isinstance(func, np.ufunc):
+        return func(values, out=out)
+    if out is None:
+        return func(values)
+    out[...] = func(values)
+    return out
+
+
+def make_converter(unit, output):
+    '''
+    Creates a function which converts values from one unit to another.
+
+    All lookups are performed once, so this should be preferred over calling
+    ``convert()`` repeatedly when converting many values between the same
+    units. Unlike ``convert()``, decimal values are not supported and must be
+    converted to floats first.
+
+    :param unit: the unit to convert from.
+    :type unit: string
+    :param output: the unit to convert to.
+    :type output: string
+    :returns: the conversion function
+    :rtype: function
+    :raises: ValueError -- if any of the units are not known.
+    '''
+    return _converter(normalise(unit), normalise(output))
+
+
+def convert_many(values, units, outputs):
+    '''
+    Converts an array of values where each value may have different units.
+
+    Each unit is only normalised and looked up once and values converted by a
+    multiplier are converted together by gathering the multipliers.
+
+    :param values: the values to convert.
+    :type values: np.ndarray or np.ma.MaskedArray
+    :param units: the unit to convert each value from or a single unit.
+    :type units: np.ndarray or string
+    :param outputs: the unit to convert each value to or a single unit.
+    :type outputs: np.ndarray or string
+    :returns: a new array of converted values
+    :rtype: np.ndarray or np.ma.MaskedArray
+    :raises: ValueError -- if any of the units are not known.
+    '''
+    data = np.ma.getdata(values)
+    shape = data.shape
+    data = data.ravel()
+    units, outputs = _unit_codes(units, shape, 'input'), _unit_codes(outputs, shape, 'output')
+
+    factors = _MULTIPLIER_MATRIX[units, outputs]
+    result = data * factors
+    # Convert values without a multiplier separately for each pair of units:
+    missing = np.isnan(factors)
+    if missing.any():
+        for pair in np.unique(units[missing] * len(_UNITS) + outputs[missing]).tolist():
+            unit, output = divmod(pair, len(_UNITS))
+            selected = (units == unit) & (outputs == output)
+            result[selected] = _converter(_UNITS[unit], _UNITS[output])(data[selected])
+
+    result = result.reshape(shape)
+    if isinstance(values, np.ma.MaskedArray):
+        # The mask is copied so that the result does not share it with the input:
+        return np.ma.array(result, mask=np.ma.getmaskarray(values).copy())
+    return result
+
+
+def _unit_codes(units, shape, kind):
+    '''
+    Looks up the integer codes for an array of units or a single unit.
+
+    Each distinct unit is only looked up once. Units are not sorted as they
+    may mix ``str`` and ``bytes`` which can't be compared.
+
+    :returns: a flat array of unit codes for an array of the given shape.
+    :raises: ValueError -- if any of the units are not known.
+    '''
+    if np.ndim(units) == 0:
+        return np.full(np.prod(shape, dtype=int), _unit_code(units, kind))
+    units = np.broadcast_to(units, shape).ravel().tolist()
+    codes = {unit: _unit_code(unit, kind) for unit in dict.fromkeys(units)}
+    return np.fromiter(map(codes.__getitem__, units), dtype=int, count=len(units))
+
+
+def _unit_code(unit, kind):
+    '''
+    Looks up the integer code for a unit after normalising it.
+
+    :raises: ValueError -- if the unit is not known.
+    '''
     try:
-        if unit0 in CONVERSION_FUNCTIONS:
-            return function(unit0, unit1)(value)
-        if unit0 in CONVERSION_MULTIPLIERS:
-            return value * multiplier(unit0, unit1)
-        raise ValueError('Unknown input unit: %s' % unit0)
+        return _UNIT_CODES[normalise(unit)]
     except KeyError:
-        raise ValueError('Unknown output unit: %s' % unit1)
+        raise ValueError('Unknown %s unit: %s' % (kind, normalise(unit))) from None
+
+
+@functools.lru_cache(maxsize=1024)
+def _conversion(unit, output):
+    '''
+    Resolves the conversion between the units provided.
+
+    Results are cached against the units as provided, so converting between
+    the same units again is a single lookup without normalising aliases.
+
+    :returns: None if the units are equivalent, otherwise the conversion
+        function and the ufunc operations for converting arrays, if any.
+    :raises: ValueError -- if any of the units are not known.
+    '''
+    unit, output = normalise(unit), normalise(output)
+    if unit == output:
+        return None
+    func = _converter(unit, output)
+    if (unit, output) in _MULTIPLIERS:
+        return func, ((np.multiply, _MULTIPLIERS[unit, output]),)
+    return func, _INPLACE_CONVERSIONS.get((unit, output))
+
+
+def _apply(operations, values, out=None):
+    '''
+    Applies a sequence of ufunc operations to an array of values.
+
+    The first operation creates the result, or writes it to ``out``, and the
+    remaining operations are applied to the result in place. Scalar results,
+    e.g. from 0-d arrays, are replaced by each operation instead.
+    '''
+    (ufunc, operand), *operations = operations
+    result = ufunc(values, operand, out=out)
+    if not isinstance(result, np.ndarray):
+        for ufunc, operand in operations:
+            result = ufunc(result, operand)
+        return result
+    for ufunc, operand in operations:
+        ufunc(result, operand, out=result)
+    return result
+
+
+def _converter(unit, output):
+    '''
+    Looks up the conversion function for a pair of normalised units.
+
+    :raises: ValueError -- if any of the units are not known.
+    '''
+    func = _function(unit, output)
+    if func is None:
+        if unit in CONVERSION_FUNCTIONS or unit in CONVERSION_MULTIPLIERS:
+            raise ValueError('Unknown output unit: %s' % output)
+        raise ValueError('Unknown input unit: %s' % unit)
+    return func
 
 
 def localise(value, unit, profile, reverse=False):
@@ -0,0 +1,120 @@
+import copy
+import unittest
+
+import numpy as np
+
+from flightdatautilities.state_mappings import (
+    build_state_lookup_array,
+    get_parameter_correction,
+    lookup_states,
+    normalise_discrete_mapping,
+    normalise_multistate_mapping,
+)
+
+
+class TestGetParameterCorrection(unittest.TestCase):
+
+    def test_exact_match(self):
+        self.assertEqual(get_parameter_correction('APU Fire'), {1: 'Fire'})
+
+    def test_wildcard_match(self):
+        self.assertEqual(get_parameter_correction('Eng (1) Fire (2)'), {1: 'Fire'})
+        self.assertEqual(get_parameter_correction('Gear (L) Down (Capt)'), {1: 'Down', 0: 'Up'})
+
+    def test_wildcard_missing_option(self):
+        self.assertEqual(get_parameter_correction('Eng Fire'), {1: 'Fire'})
+        self.assertEqual(get_parameter_correction('Event Marker'), {1: 'Event'})
+
+    def test_no_match(self):
+        self.assertIsNone(get_parameter_correction('Airspeed'))
+        self.assertIsNone(get_parameter_correction('Eng (Unknown) Fire'))
+        self.assertIsNone(get_parameter_correction('APU Fire Extra'))
+
+    def test_cached(self):
+        get_parameter_correction.cache_clear()
+        mapping = get_parameter_correction('Eng (1) Running')
+        self.assertIs(get_parameter_correction('Eng (1) Running'), mapping)
+        self.assertEqual(get_parameter_correction.cache_info().hits, 1)
+
+    def test_read_only(self):
+        mapping = get_parameter_correction('APU Fire')
+        with self.assertRaises(TypeError):
+            mapping[0] = '-'
+
+
+class TestNormaliseDiscreteMapping(unittest.TestCase):
+
+    def test_corrections(self):
+        mapping, inverted = normalise_discrete_mapping({0: 'NOT ENGAGED', 1: 'ENGAGED'})
+        self.assertEqual(mapping, {0: '-', 1: 'Engaged'})
+        self.assertFalse(inverted)
+
+    def test_inverted(self):
+        mapping, inverted = normalise_discrete_mapping({0: 'OPEN', 1: 'CLOSED'})
+        self.assertEqual(mapping, {0: 'Open', 1: 'Closed'})
+        self.assertTrue(inverted)
+
+    def test_parameter_correction(self):
+        mapping, inverted = normalise_discrete_mapping({0: '-', 1: 'ON'}, 'Eng (2) Fire')
+        self.assertEqual(mapping, {1: 'Fire'})
+        self.assertIs(type(mapping), dict)
+        self.assertEqual(copy.deepcopy(mapping), {1: 'Fire'})
+        self.assertFalse(inverted)
+
+
+class TestNormaliseMultistateMapping(unittest.TestCase):
+
+    def test_corrections(self):
+        mapping = normalise_multistate_mapping({0: 'NONE', 1: 'ARMED', 2: 'Custom'})
+        self.assertEqual(mapping, {0: '-', 1: 'Armed', 2: 'Custom'})
+
+    def test_parameter_correction(self):
+        mapping = normalise_multistate_mapping({0: 'OFF', 1: 'ON'}, 'AC Bus (1) Status')
+        self.assertEqual(mapping, {1: 'Powered'})
+        self.assertIs(type(mapping), dict)
+        self.assertEqual(copy.deepcopy(mapping), {1: 'Powered'})
+
+    def test_parameter_correction_not_state_corrected(self):
+        # 'Selected On' is itself in STATE_CORRECTIONS but parameter corrections are used as defined.
+        mapping = normalise_multistate_mapping({0: 'OFF', 1: 'ON'}, 'Wing Anti Ice Selected On')
+        self.assertEqual(mapping, {1: 'Selected On'})
+
+
+class TestBuildStateLookupArray(unittest.TestCase):
+
+    def test_lookup(self):
+        lookup = build_state_lookup_array({0: 'Off', 1: 'On', 3: 'Fault'})
+        self.assertEqual(lookup.tolist(), ['Off', 'On', None, 'Fault'])
+        values = np.array([1, 0, 3, 2, 1])
+        self.assertEqual(lookup[values].tolist(), ['On', 'Off', 'Fault', None, 'On'])
+
+    def test_default(self):
+        lookup = build_state_lookup_array({2: 'Armed'}, default='-')
+        self.assertEqual(lookup.tolist(), ['-', '-', 'Armed'])
+
+    def test_empty(self):
+        self.assertEqual(len(build_state_lookup_array({})), 0)
+
+    def test_negative(self):
+        self.assertRaises(ValueError, build_state_lookup_array, {-1: 'Off', 1: 'On'})
+
+
+class TestLookupStates(unittest.TestCase):
+
+    def test_lookup(self):
+        lookup = build_state_lookup_array({0: 'Off', 1: 'On', 3: 'Fault'}, default='-')
+        values = np.array([1, 0, 3, 2])
+        self.assertEqual(lookup_states(lookup, values).tolist(), ['On', 'Off', 'Fault', '-'])
+
+    def test_out_of_range(self):
+        lookup = build_state_lookup_array({0: 'Off', 1: 'On'})
+        with self.assertRaises(IndexError):
+            lookup[np.array([2])]
+        values = np.array([2, -1, 1, 0])
+        self.assertEqual(lookup_states(lookup, values).tolist(), [None, None, 'On', 'Off'])
+        self.assertEqual(lookup_states(lookup, values, default='?').tolist(), ['?', '?', 'On', 'Off'])
+
+    def test_shape(self):
+        lookup = build_state_lookup_array({0: 'Off', 1: 'On'})
+        states = lookup_states(lookup, np.array([[0, 1], [5, -3]]))
+        self.assertEqual(states.tolist(), [['Off', 'On'], [None, None]])
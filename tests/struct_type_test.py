@@ -1,3 +1,5 @@
+import copy
+import pickle
 import unittest
 
 from flightdatautilities.struct_type import Struct
@@ -29,6 +31,19 @@ class TestStruct(unittest.TestCase):
         aircraft = Struct(Struct(model=Struct(dist_gear_to_tail=200)))
         self.assertEqual(aircraft.model.dist_gear_to_tail, 200)
 
+    def test_create_deeply_nested(self):
+        '''
+        '''
+        d = x = {}
+        for _ in range(5000):
+            x['x'] = x = {}
+        x['y'] = 1
+        s = Struct(d)
+        for _ in range(5000):
+            s = s.x
+            self.assertIsInstance(s, Struct)
+        self.assertEqual(s, Struct(y=1))
+
     def test_create_from_generator(self):
         '''
         '''
@@ -136,6 +151,16 @@ class TestStruct(unittest.TestCase):
         s = Struct()
         self.assertRaises(AttributeError, getattr, s, '__magic__')
 
+    def test_copy_and_pickle(self):
+        '''
+        '''
+        s = Struct(x=Struct(y=1))
+        for other in copy.copy(s), copy.deepcopy(s), pickle.loads(pickle.dumps(s)):
+            self.assertEqual(other, s)
+            self.assertIsInstance(other.x, Struct)
+        # Probing for magic attributes must not create new structures:
+        self.assertEqual(s, Struct(x=Struct(y=1)))
+
     def test_no_shared_references(self):
         '''
         '''
@@ -148,6 +173,20 @@ class TestStruct(unittest.TestCase):
         s0.x.x = 1
         self.assertEqual(s1.x.x, 0)
 
+    def test_cycles(self):
+        '''
+        '''
+        d = {}
+        d['a'] = d
+        self.assertRaises(ValueError, Struct, d)
+        d = {'a': {}}
+        d['a']['b'] = d
+        self.assertRaises(ValueError, Struct, d)
+        self.assertRaises(ValueError, Struct, x=d)
+        # Repeated references which are not cycles are fine:
+        x = {'y': 1}
+        self.assertEqual(Struct(a=x, b={'c': x}), Struct(a=Struct(y=1), b=Struct(c=Struct(y=1))))
+
     def test_to_dict(self):
         '''
         '''
@@ -2,7 +2,12 @@ import re
 import unittest
 from datetime import date, datetime, timezone
 
-from flightdatautilities.types import AIRAC, TACAN
+from flightdatautilities.types import (
+    AIRAC,
+    GLIDESLOPE_TO_LOCALIZER_FREQUENCY_MAPPING,
+    LOCALIZER_TO_GLIDESLOPE_FREQUENCY_MAPPING,
+    TACAN,
+)
 
 
 class AIRACTest(unittest.TestCase):
@@ -30,6 +35,13 @@ class AIRACTest(unittest.TestCase):
         with self.assertRaisesRegex(TypeError, r'^AIRAC objects are immutable\.$'):
             AIRAC('1913').timestamp = 0
 
+    def test_cached_properties(self):
+        obj = AIRAC('1913')
+        self.assertIs(obj.effective, obj.effective)
+        self.assertIs(obj.identifier, obj.identifier)
+        with self.assertRaisesRegex(TypeError, r'^AIRAC objects are immutable\.$'):
+            obj._effective = None
+
     def test_str(self):
         obj = AIRAC('1913')
         self.assertEqual(str(obj), '1913')
@@ -72,6 +84,12 @@ class AIRACTest(unittest.TestCase):
                 self.assertEqual(a.effective, effective)
                 self.assertEqual(a.identifier, identifier)
 
+    def test_integer_timestamp(self):
+        values = ('1906', 1558569600, 1558569600.5, date(2019, 5, 23), datetime(2019, 5, 23, tzinfo=timezone.utc))
+        for value in values:
+            with self.subTest(value):
+                self.assertIsInstance(AIRAC(value).timestamp, int)
+
     def test_floored_to_effective(self):
         for day in range(23, 31):
             value = datetime(2019, 5, day, tzinfo=timezone.utc)
@@ -293,7 +311,7 @@ class TACANTest(unittest.TestCase):
         self._test_constructor_error(1, 1.2, None, True, False, set(), (), [], {}, b'', exception=TypeError)
 
     def test_invalid_value(self):
-        self._test_constructor_error('', '10Z', exception=ValueError)
+        self._test_constructor_error('', '10Z', '01X', '1x', '1X\n', exception=ValueError)
 
     def test_out_of_range(self):
         self._test_constructor_error('0X', '0Y', '127X', '127Y', exception=ValueError)
@@ -334,6 +352,12 @@ class TACANTest(unittest.TestCase):
                     else:
                         self.assertAlmostEqual(result, frequency, places=2)
 
+    def test_to_frequency_invalid(self):
+        with self.assertRaisesRegex(ValueError, r'^Expected navaid argument'):
+            TACAN('18X').to_frequency('ndb')
+        self.assertIsNone(TACAN('1X').to_frequency('vor'))
+        self.assertIsNone(TACAN('16X').to_frequency('glideslope'))
+
     def test_from_frequency(self):
         for channel, data in self.DATA:
             for navaid, frequency in data.items():
@@ -342,3 +366,15 @@ class TACANTest(unittest.TestCase):
                 with self.subTest(frequency=frequency):
                     result = TACAN.from_frequency(frequency)
                     self.assertEqual(result, (channel, navaid))
+
+    def test_from_frequency_invalid(self):
+        self.assertIsNone(TACAN.from_frequency(100.0))
+        self.assertIsNone(TACAN.from_frequency(340.0))
+        self.assertEqual(TACAN.from_frequency('108.1'), ('18X', 'localizer'))
+        self.assertEqual(TACAN.from_frequency(108.11), ('18X', 'localizer'))
+
+    def test_frequency_mappings(self):
+        self.assertEqual(len(LOCALIZER_TO_GLIDESLOPE_FREQUENCY_MAPPING), len(GLIDESLOPE_TO_LOCALIZER_FREQUENCY_MAPPING))
+        self.assertEqual(GLIDESLOPE_TO_LOCALIZER_FREQUENCY_MAPPING[334.70], 108.10)
+        with self.assertRaises(TypeError):
+            LOCALIZER_TO_GLIDESLOPE_FREQUENCY_MAPPING[108.00] = 334.00
@@ -1,6 +1,8 @@
 import itertools
 import unittest
 
+import numpy as np
+
 from decimal import Decimal
 
 from flightdatautilities.units import *  # noqa
@@ -30,25 +32,84 @@ class TestUnitsModule(unittest.TestCase):
         # Check we only convert to and from standard units:
         self.assertLessEqual(set(STANDARD_CONVERSIONS.keys()), values)
         self.assertLessEqual(set(STANDARD_CONVERSIONS.values()), values)
+        # Check conversions are resolved in a single step and are supported:
+        for mapping in (STANDARD_CONVERSIONS, *UNIT_PROFILE_CONVERSIONS.values()):
+            self.assertEqual(set(mapping.keys()) & set(mapping.values()), set())
+            for k, v in mapping.items():
+                self.assertIsNotNone(function(k, v), (k, v))
         for mapping in CONVERSION_MULTIPLIERS, CONVERSION_FUNCTIONS:
             for k, v in mapping.items():
                 self.assertIn(k, values)
                 self.assertLessEqual(set(v.keys()), values)
 
+    def test__check_multipliers(self):
+
+        # Check multipliers are consistent in both directions and with any
+        # conversion via an intermediate unit:
+        for unit, row in CONVERSION_MULTIPLIERS.items():
+            for output, value in row.items():
+                if unit in CONVERSION_MULTIPLIERS.get(output, {}):
+                    self.assertAlmostEqual(value * CONVERSION_MULTIPLIERS[output][unit], 1, delta=1e-4,
+                                           msg=(unit, output))
+                for other, other_value in CONVERSION_MULTIPLIERS.get(output, {}).items():
+                    if other != unit and other in row:
+                        self.assertAlmostEqual(value * other_value / row[other], 1, delta=1e-4,
+                                               msg=(unit, output, other))
+
+    def test__read_only(self):
+
+        mappings = (
+            CONVERSION_MULTIPLIERS, CONVERSION_FUNCTIONS, STANDARD_CONVERSIONS, UNIT_DISPLAY, UNIT_CORRECTIONS,
+            UNIT_CATEGORIES, UNIT_DESCRIPTIONS, UNIT_PROFILE_CONVERSIONS,
+        )
+        for mapping in mappings:
+            with self.assertRaises(TypeError):
+                mapping['unknown'] = {}
+        with self.assertRaises(TypeError):
+            CONVERSION_MULTIPLIERS[FT][METER] = 1
+        with self.assertRaises(TypeError):
+            UNIT_PROFILE_CONVERSIONS[US_PROFILE][METER] = METER
+
+    def test__available(self):
+
+        values = available()
+        self.assertIsInstance(values, tuple)
+        self.assertIn(FT, values)
+        self.assertNotIn(US_PROFILE, values)
+        self.assertIs(available(), values)
+        module, constants = available(values=False)
+        self.assertEqual(tuple(getattr(module, c) for c in constants), values)
+
     def test__normalise(self):
 
         for wrong, correct in UNIT_CORRECTIONS.items():
             self.assertEqual(normalise(wrong), correct)
 
-    @unittest.skip('Test not implemented.')
+    def test__category(self):
+
+        for name, units in UNIT_CATEGORIES.items():
+            for unit in units:
+                self.assertEqual(category(unit), name)
+        self.assertEqual(category('feet'), 'Length')
+        self.assertEqual(category('degC'), 'Temperature')
+        self.assertIsNone(category('unknown'))
+
     def test__function(self):
 
-        pass
+        self.assertEqual(function(FT, FT)(5), 5)
+        self.assertEqual(function('feet', FT)(5), 5)
+        self.assertAlmostEqual(function(FT, METER)(1), 0.3048)
+        self.assertAlmostEqual(function(CELSIUS, FAHRENHEIT)(100), 212)
+        self.assertIsNone(function(FT, CELSIUS))
+        self.assertIsNone(function('unknown', FT))
+        # Check that functions are cached for each pair of units:
+        self.assertIs(function(FT, METER), function(FT, METER))
 
-    @unittest.skip('Test not implemented.')
     def test__multiplier(self):
 
-        pass
+        self.assertEqual(multiplier(FT, FT), 1)
+        self.assertEqual(multiplier(FT, METER), 0.3048)
+        self.assertRaises(KeyError, multiplier, FT, CELSIUS)
 
     def test__convert(self):
 
@@ -75,6 +136,7 @@ class TestUnitsModule(unittest.TestCase):
             (1, LB_MIN, TONNE_H): 0.0272155422,
             (1, KG_H, LB_H): 2.20462,
             (1, KG_H, LB_MIN): 0.0367437104,
+            (1, KG_H, KG_S): 0.000277778,
             (1, KG_H, TONNE_H): 0.001,
             (1, TONNE_H, LB_H): 2204.62,
             (1, TONNE_H, LB_MIN): 36.7437104,
@@ -92,6 +154,14 @@ class TestUnitsModule(unittest.TestCase):
             (1, LITER_H, PINT_H): 2.11338,
             (1, LITER_H, QUART_H): 1.05669,
             (1, LITER_H, GALLON_H): 0.264172,
+            (1, GALLON_S, GALLON_H): 3600,
+            (1, GALLON_S, PINT_H): 28800,
+            (1, GALLON_S, LITER_H): 13627.4765,
+            (1, GALLON_S, CUFT_M): 8.02083333,
+            (3600, GALLON_H, GALLON_S): 1,
+            (1, CUFT_M, GALLON_S): 0.124675843,
+            (1, CUFT_M, LITER_H): 1699.01080,
+            (1, LITER_H, CUFT_M): 0.000588578,
             # Force:
             (1, LBF, KGF): 0.45359237,
             (1, LBF, DECANEWTON): 0.444822162,
@@ -177,6 +247,13 @@ class TestUnitsModule(unittest.TestCase):
             (1, PSI, MILLIBAR): 68.94757,       # Google: 68.9475729
             (1, PSI, PASCAL): 6894.757,
             (1, PSI, HECTOPASCAL): 68.94757,
+            (1, BAR, MILLIBAR): 1000,
+            (1, BAR, KILOPASCAL): 100,
+            (1, KILOPASCAL, HECTOPASCAL): 10,
+            (1, KILOPASCAL, BAR): 0.01,
+            (1, INHG, KILOPASCAL): 3.386389,
+            (1, PSI, KILOPASCAL): 6.894757,
+            (1, PSI, BAR): 0.0689475729,
             # Speed:
             (1, KT, MPH): 1.15078,
             (1, KT, FPM): 101.2686,
@@ -222,7 +299,7 @@ class TestUnitsModule(unittest.TestCase):
             # Torque:
             (1, FT_LB, IN_LB): 12,
             (1, FT_LB, IN_OZ): 192,
-            (1, IN_LB, FT_LB): 0.0833,
+            (1, IN_LB, FT_LB): 0.0833333,
             (1, IN_LB, IN_OZ): 16,
             (1, IN_OZ, FT_LB): 0.00520833,
             (1, IN_OZ, IN_LB): 0.0625,
@@ -244,6 +321,7 @@ class TestUnitsModule(unittest.TestCase):
             (1, LOC_DDM, DOTS): 12.903225806451614,
             (1, MILLIVOLT, DOTS): 0.01333333333333333,
             (1, MICROAMP, DOTS): 0.01333333333333333,
+            (1, MICROVOLT, MILLIVOLT): 0.001,
             (1, DOTS, GS_DDM): 0.0875,
             (1, DOTS, LOC_DDM): 0.0775,
             (1, DOTS, MILLIVOLT): 75,
@@ -262,3 +340,97 @@ class TestUnitsModule(unittest.TestCase):
             o = arguments[0]
             m = 'Invalid reverse conversion from %s --> %s' % i[1:]
             self.assertAlmostEqual(convert(*i), o, delta=0.001, msg=m)
+
+    def test__convert_numpy(self):
+
+        array = np.array([-40, 0, 100])
+        result = convert(array, CELSIUS, FAHRENHEIT)
+        np.testing.assert_allclose(result, [-40, 32, 212])
+        np.testing.assert_array_equal(array, [-40, 0, 100])
+        np.testing.assert_allclose(convert(np.array([491.67]), RANKINE, CELSIUS), [0], atol=1e-9)
+        self.assertEqual(convert(np.array(100.0), CELSIUS, FAHRENHEIT), 212.0)
+        # Check that arrays are converted exactly as the conversion functions would:
+        array = np.linspace(-500.0, 500.0, 1001)
+        units = CELSIUS, FAHRENHEIT, KELVIN, RANKINE
+        for unit, output in itertools.permutations(units, 2):
+            np.testing.assert_array_equal(convert(array, unit, output), CONVERSION_FUNCTIONS[unit][output](array))
+        np.testing.assert_allclose(convert(np.array([1.0, 2.0]), FT, METER), [0.3048, 0.6096])
+        np.testing.assert_allclose(convert(np.array([180.0]), DEGREE, RADIAN), [np.pi])
+        masked = np.ma.array([0, 100], mask=[True, False])
+        result = convert(masked, CELSIUS, KELVIN)
+        self.assertIsInstance(result, np.ma.MaskedArray)
+        np.testing.assert_array_equal(result.mask, [True, False])
+
+    def test__convert_array(self):
+
+        values = np.array([1.0, 2.0])
+        np.testing.assert_allclose(convert_array(values, FT, METER), [0.3048, 0.6096])
+        np.testing.assert_allclose(convert_array(values, DEGREE, RADIAN), np.radians(values))
+        np.testing.assert_allclose(convert_array([0, 100], CELSIUS, FAHRENHEIT), [32, 212])
+        self.assertIs(convert_array(values, FT, 'feet'), values)
+        np.testing.assert_array_equal(values, [1.0, 2.0])
+        # Check conversion into an existing array and in place:
+        out = np.empty(2)
+        self.assertIs(convert_array(values, FT, FT, out=out), out)
+        np.testing.assert_array_equal(out, [1.0, 2.0])
+        self.assertIs(convert_array(values, CELSIUS, KELVIN, out=out), out)
+        np.testing.assert_allclose(out, [274.15, 275.15])
+        self.assertIs(convert_array(values, DEGREE, RADIAN, out=values), values)
+        np.testing.assert_allclose(values, np.radians([1.0, 2.0]))
+        self.assertRaisesRegex(ValueError, 'Unknown output unit', convert_array, values, FT, CELSIUS)
+        # Check scalars and 0-d arrays are converted as by the conversion functions:
+        self.assertEqual(convert_array(5.0, FT, METER), 5.0 * 0.3048)
+        self.assertEqual(convert_array(100.0, CELSIUS, FAHRENHEIT), 212.0)
+        self.assertEqual(convert_array(np.array(37.0), CELSIUS, FAHRENHEIT), CONVERSION_FUNCTIONS[CELSIUS][FAHRENHEIT](37.0))
+        # Check converted values can only be stored in floating point arrays:
+        integers = np.array([1, 2])
+        self.assertRaisesRegex(ValueError, 'floating point', convert_array, integers, FT, METER, out=integers)
+        self.assertIs(convert_array(integers, FT, FT, out=integers), integers)
+
+    def test__make_converter(self):
+
+        converter = make_converter('feet', 'meters')
+        self.assertAlmostEqual(converter(1), 0.3048)
+        np.testing.assert_allclose(converter(np.array([1, 2])), [0.3048, 0.6096])
+        self.assertEqual(make_converter(FT, 'feet')(5), 5)
+        self.assertAlmostEqual(make_converter(CELSIUS, FAHRENHEIT)(100), 212)
+        self.assertRaisesRegex(ValueError, 'Unknown input unit', make_converter, 'unknown', FT)
+        self.assertRaisesRegex(ValueError, 'Unknown output unit', make_converter, FT, 'unknown')
+        # Decimal values must be converted to floats first:
+        self.assertRaises(TypeError, make_converter(FT, METER), Decimal('1'))
+        self.assertRaises(TypeError, make_converter(CELSIUS, FAHRENHEIT), Decimal('1'))
+        self.assertAlmostEqual(make_converter(FT, METER)(float(Decimal('1'))), 0.3048)
+
+    def test__convert_many(self):
+
+        values = np.array([1.0, 2.0, 3.0, 100.0, np.pi])
+        units = np.array([FT, 'feet', KT, CELSIUS, RADIAN])
+        outputs = np.array([METER, METER, MPH, FAHRENHEIT, DEGREE])
+        expected = [convert(v, u, o) for v, u, o in zip(values, units, outputs)]
+        np.testing.assert_allclose(convert_many(values, units, outputs), expected)
+        np.testing.assert_allclose(convert_many([1, 2], [CELSIUS, KELVIN], KELVIN), [274.15, 2])
+        np.testing.assert_array_equal(convert_many([[1, 2]], PERCENT, PERCENT), [[1, 2]])
+        # Check units may mix bytes and strings as convert() accepts both:
+        units = np.array([b'\xb0C', CELSIUS, b'\xb0C'], dtype=object)
+        np.testing.assert_allclose(convert_many([0, 100, 100], units, FAHRENHEIT), [32, 212, 212])
+        original = np.ma.array([1.0, 2.0, 3.0], mask=[False, True, False])
+        masked = convert_many(original, FT, METER)
+        np.testing.assert_array_equal(masked.mask, [False, True, False])
+        # Check the mask is not shared with the input:
+        masked[0] = np.ma.masked
+        np.testing.assert_array_equal(original.mask, [False, True, False])
+        self.assertIsInstance(convert_many(np.ma.array([1.0, 2.0]), FT, METER), np.ma.MaskedArray)
+        self.assertRaisesRegex(ValueError, 'Unknown input unit', convert_many, values, 'unknown', FT)
+        self.assertRaisesRegex(ValueError, 'Unknown output unit', convert_many, values, FT, 'unknown')
+        self.assertRaisesRegex(ValueError, 'Unknown output unit', convert_many, values, FT, CELSIUS)
+
+    def test__convert_errors(self):
+
+        self.assertEqual(convert(Decimal('1.5'), FT, 'feet'), Decimal('1.5'))
+        self.assertIsInstance(convert(Decimal('1'), FT, METER), float)
+        with self.assertRaisesRegex(ValueError, 'Unknown input unit'):
+            convert(1, 'unknown', FT)
+        with self.assertRaisesRegex(ValueError, 'Unknown output unit'):
+            convert(1, FT, 'unknown')
+        with self.assertRaisesRegex(ValueError, 'Unknown output unit'):
+            convert(1, CELSIUS, FT)